@@ -1,20 +1,21 @@
 x = [1,2,3,4,5]
-squared=list(map(lambda x: x ** 2, x))
+# comprehension skips the per-element lambda call
+squared=[i ** 2 for i in x]
 print(squared)
 
 numbers = [1, 2, 3, 4, 5]
 
 def func(x):
-    return x ** 2
+    # x * x is cheaper than x ** 2 (no __pow__ dispatch)
+    return x * x
 # map to list using func
 val = list(map(func, numbers))
 
 print (val)
 
-for x1 in val:
-    print(x1)
+# single write instead of a print per element
+print('\n'.join(map(str, val)))
 
-# map to list using lambda
-val = list(map(lambda x : x ** 2, numbers))
-for x1 in val:
-    print('lambda {}'.format(x1))
\ No newline at end of file
+# comprehension instead of map with lambda
+val = [i ** 2 for i in numbers]
+print('\n'.join('comprehension {}'.format(x1) for x1 in val))
\ No newline at end of file
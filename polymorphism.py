@@ -1,23 +1,23 @@
 class Animal:
-    def __init__(self, courseName):
-        self._courseName = courseName
-
-    @property
-    def course(self):
-        return self._courseName
+    # __slots__ drops the per-instance __dict__
+    __slots__ = ('course',)
 
-    @course.setter
-    def course(self, courseName):
-        self._courseName = courseName
+    def __init__(self, courseName):
+        # plain attribute - the property was a passthrough with no validation
+        self.course = courseName
 
     def talk(self):
         print('baby')
 
 class Cat (Animal):
+    __slots__ = ()
+
     def talk(self):
         print("meow")
 
 class Dog (Animal):
+    __slots__ = ()
+
     def talk1(self):
         print("Woof")
 
@@ -28,19 +28,18 @@ cat.course = 'ran'
 dog.talk()
 print(cat.course)
 
+# dispatch table: one dict lookup instead of an MRO walk per call
+_DISPATCH = {Animal: Animal.talk, Cat: Cat.talk, Dog: Dog.talk1}
 
-class Test:
+for animal in (cat, dog):
+    _DISPATCH[type(animal)](animal)
 
-    def __init__(self):
-        self.__color = "red"
 
-    @property
-    def color(self):
-        return self.__color
+class Test:
+    __slots__ = ('color',)
 
-    @color.setter
-    def color(self,clr):
-        self.__color = clr
+    def __init__(self):
+        self.color = "red"
 
 
 
@@ -5,16 +5,21 @@ dicts=[
     {'id':4, 'name':'kang', 'age': 50}
 ]
 
-ret = next(( item for item in dicts if item['id'] == 2), None)
+# index by id once, then each lookup is a single hash probe
+by_id = {item['id']: item for item in dicts}
+ret = by_id.get(2)
 print (ret)
 
-ret = next(( index for (index, item) in enumerate(dicts) if item['id'] == 1), None)
+# position lookup by id
+pos_by_id = {item['id']: index for (index, item) in enumerate(dicts)}
+ret = pos_by_id.get(1)
 print (ret)
 
 t = ((1,'a'), (2, 'b'))
 
-#map
-ret = dict(map(reversed, t))
+#zip - one C-level unpack + zip instead of a reversed iterator per pair
+ks, vs = zip(*t)
+ret = dict(zip(vs, ks))
 
 print (ret)
 